@@ -5,30 +5,74 @@ mini-matchers: 軽量スマートアサーションライブラリ
 動的な値を含む複雑なテストシナリオを簡潔に記述できます。
 """
 
-from .matchers import (
-    MatcherProtocol,
-    SmartMatcher,
-    regex,
-    around_now,
-    greater_than,
-    less_than,
-    any_of,
-    contains,
-)
+from typing import TYPE_CHECKING
 
 # パブリックAPIのエクスポート
 __all__ = [
     # コアクラス（拡張用）
     'MatcherProtocol',
-    
+
     # スマートマッチャー（メイン機能）
     'SmartMatcher',
+    'MatcherDict',
+    'expect',
     'regex',
+    'any_of_regex',
     'around_now',
     'greater_than',
     'less_than',
     'any_of',
     'contains',
+    'use_re2',
 ]
 
-__version__ = "0.1.0"
\ No newline at end of file
+__version__ = "0.1.0"
+
+# 属性名 -> 実装サブモジュール の対応（PEP 562の遅延インポート用）
+_SUBMODULES = {
+    'MatcherProtocol': '_base',
+    'SmartMatcher': '_base',
+    'MatcherDict': '_base',
+    'expect': '_base',
+    'regex': '_regex',
+    'any_of_regex': '_regex',
+    'use_re2': '_regex',
+    'around_now': '_time',
+    'greater_than': '_numeric',
+    'less_than': '_numeric',
+    'any_of': '_string',
+    'contains': '_string',
+}
+
+
+def __getattr__(name: str):
+    """PEP 562による遅延インポート
+
+    初回アクセス時に必要なサブモジュールだけを読み込むことで、
+    reやdatetimeを使わない利用者のインポート時間を短縮します。
+    """
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    # 次回以降はモジュール属性として直接解決される
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .matchers import (
+        MatcherProtocol,
+        SmartMatcher,
+        MatcherDict,
+        expect,
+        regex,
+        any_of_regex,
+        around_now,
+        greater_than,
+        less_than,
+        any_of,
+        contains,
+        use_re2,
+    )
@@ -0,0 +1,183 @@
+"""
+スマートマッチャーの基盤モジュール
+
+MatcherProtocol・SmartMatcher・MatcherDictなど、個別のマッチャー実装に
+依存しないコア部分を提供します。reやdatetimeといった重いモジュールは
+インポートしません。
+"""
+
+from typing import Any, TYPE_CHECKING
+
+
+# ===== プロトコルとベースクラス =====
+
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    class MatcherProtocol(Protocol):
+        """すべてのマッチャーが実装すべきプロトコル"""
+
+        negated: bool
+
+        def matches(self, actual: Any) -> bool:
+            """実際の値がマッチするかを判定"""
+            ...
+
+        def describe_mismatch(self, actual: Any) -> str:
+            """マッチしない場合の説明を生成"""
+            ...
+
+        def describe_expected(self) -> str:
+            """期待値の説明を生成"""
+            ...
+else:
+    class MatcherProtocol:
+        """MatcherProtocolの実行時スタブ
+
+        PEP 544のProtocol機構はクラス生成時にメタクラス処理を伴うため、
+        実行時は軽量な通常クラスとして公開します。インターフェースの
+        定義は静的型チェック時（TYPE_CHECKING）のみProtocolとして
+        評価されます。
+        """
+
+
+# ===== スマートマッチャーシステム =====
+
+class SmartMatcher:
+    """スマートアサーション用のベースクラス
+
+    == 演算子をオーバーライドして、通常のassert文でマッチャーを使用可能にします。
+
+    説明文字列（describe_expected / describe_mismatch）は__repr__や
+    explain()が呼ばれたときにのみ組み立てられ、比較そのものでは
+    一切フォーマット処理を行いません。
+    """
+
+    __slots__ = ('matcher', '_matches', '_negated')
+
+    def __init__(self, matcher: MatcherProtocol):
+        """SmartMatcherを初期化
+
+        matchesとnegatedは構築時に束縛・スナップショットされます。
+        構築後にmatcher.negatedを書き換えても比較結果には反映されません。
+        """
+        self.matcher = matcher
+        self._matches = matcher.matches
+        self._negated = matcher.negated
+
+    # __eq__が値比較を乗っ取るため、意図的にハッシュ不可能にする
+    __hash__ = None
+
+    def __eq__(self, other: Any) -> bool:
+        """== 演算子をオーバーライドしてマッチング処理を実行"""
+        result = self._matches(other)
+        return (not result) if self._negated else result
+
+    def __ne__(self, other: Any) -> bool:
+        """!= 演算子をオーバーライドしてマッチング処理の否定を返す
+
+        __eq__の結果をCPythonのフォールバックで反転させる代わりに
+        直接判定することで、比較ごとのディスパッチを1段減らします。
+        """
+        result = self._matches(other)
+        return result if self._negated else (not result)
+
+    def matches_iter(self, iterable) -> list[bool]:
+        """イテラブルの各要素をまとめて判定して真偽値リストを返す
+
+        要素ごとに == 演算子（SmartMatcher.__eq__）を経由する代わりに、
+        マッチャーのバルクAPI（matches_all）があればそれを、なければ
+        ローカルに束縛したmatchesを直接呼び出します。
+        """
+        matches_all = getattr(self.matcher, 'matches_all', None)
+        if matches_all is not None:
+            results = matches_all(iterable)
+        else:
+            matches = self._matches
+            results = [matches(v) for v in iterable]
+        if self._negated:
+            return [not r for r in results]
+        return results
+
+    def explain(self, actual: Any) -> str:
+        """マッチしなかった理由の説明を生成
+
+        比較のホットパス（__eq__）では呼ばれず、失敗内容を調べたい
+        ときにのみ文字列を組み立てます。
+        """
+        return (
+            f"expected {self.matcher.describe_expected()}, "
+            f"but {self.matcher.describe_mismatch(actual)}"
+        )
+
+    def __repr__(self) -> str:
+        """SmartMatcherの文字列表現"""
+        return f"SmartMatcher({self.matcher.describe_expected()})"
+
+
+def _values_match(expected: Any, actual: Any) -> bool:
+    """期待値と実際の値を直接比較する再帰ヘルパー
+
+    SmartMatcherはmatchesを直接呼び出し、辞書・リストは要素ごとに
+    再帰します。最初の不一致で打ち切るため、汎用のdict.__eq__を
+    経由するよりPythonレベルの呼び出しが少なくなります。
+    """
+    if isinstance(expected, SmartMatcher):
+        result = expected._matches(actual)
+        return (not result) if expected._negated else result
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and _dict_matches(expected, actual)
+    if isinstance(expected, (list, tuple)):
+        if not isinstance(actual, type(expected)) or len(actual) != len(expected):
+            return False
+        return all(_values_match(e, a) for e, a in zip(expected, actual))
+    return bool(expected == actual)
+
+
+def _dict_matches(expected: dict, actual: dict) -> bool:
+    """辞書同士をキーごとに比較する（最初の不一致で打ち切り）"""
+    if len(expected) != len(actual):
+        return False
+    for key, exp in expected.items():
+        if key not in actual:
+            return False
+        if not _values_match(exp, actual[key]):
+            return False
+    return True
+
+
+class MatcherDict(dict):
+    """マッチャー入り期待値辞書のラッパー
+
+    == 演算子をオーバーライドして、dict.__eq__の汎用ディスパッチを
+    経由せずマッチャーを直接呼び出し、最初の不一致で比較を打ち切ります。
+    値が通常のオブジェクトの場合は == で比較されます。
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        """== 演算子をオーバーライドして融合されたマッチングを実行"""
+        return isinstance(other, dict) and _dict_matches(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        """!= 演算子（dict.__ne__が__eq__を迂回しないよう明示定義）"""
+        return not self.__eq__(other)
+
+
+def expect(expected: dict) -> MatcherDict:
+    """期待値辞書をMatcherDictにラップして返す
+
+    大きなネスト辞書の比較で、キーごとのマッチャー呼び出しを直接
+    ディスパッチし、最初の不一致で打ち切ります。
+
+    Args:
+        expected: マッチャーを値に含む期待値の辞書
+
+    Returns:
+        MatcherDict: 融合された比較を行う期待値辞書
+
+    Example:
+        assert actual == expect({"id": greater_than(100), "name": "Alice"})
+    """
+    return MatcherDict(expected)
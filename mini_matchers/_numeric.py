@@ -0,0 +1,120 @@
+"""
+数値比較マッチャーモジュール
+
+greater_than / less_than と対応するマッチャークラスを提供します。
+"""
+
+from typing import Any, Union
+
+from ._base import SmartMatcher
+
+# 数値マッチャーが受け付ける型（比較ごとのタプル生成を避けるため定数化）
+_NUMERIC_TYPES = (int, float)
+
+
+class GreaterThanMatcher:
+    """指定値より大きいかチェックするマッチャー"""
+
+    __slots__ = ('expected', 'negated', '_valid_expected')
+
+    def __init__(self, expected: Union[int, float]):
+        self.expected = expected
+        self.negated = False
+        # 期待値側の型チェックは比較ごとに不変なので構築時に済ませる
+        self._valid_expected = isinstance(expected, _NUMERIC_TYPES)
+
+    def matches(self, actual: Any) -> bool:
+        return (
+            self._valid_expected
+            and isinstance(actual, _NUMERIC_TYPES)
+            and actual > self.expected
+        )
+
+    def matches_all(self, iterable) -> list[bool]:
+        """複数の値をまとめて判定して真偽値リストを返す
+
+        属性検索をループの外に束縛し、要素ごとのオーバーヘッドを
+        matches()の繰り返し呼び出しより小さく抑えます。
+        """
+        if not self._valid_expected:
+            return [False for _ in iterable]
+        expected = self.expected
+        numeric = _NUMERIC_TYPES
+        return [isinstance(v, numeric) and v > expected for v in iterable]
+
+    def describe_mismatch(self, actual: Any) -> str:
+        if not isinstance(actual, (int, float)):
+            return f"was {type(actual).__name__} {actual}, expected number"
+        return f"was {actual}"
+
+    def describe_expected(self) -> str:
+        return f"number greater than {self.expected}"
+
+
+class LessThanMatcher:
+    """指定値より小さいかチェックするマッチャー"""
+
+    __slots__ = ('expected', 'negated', '_valid_expected')
+
+    def __init__(self, expected: Union[int, float]):
+        self.expected = expected
+        self.negated = False
+        # 期待値側の型チェックは比較ごとに不変なので構築時に済ませる
+        self._valid_expected = isinstance(expected, _NUMERIC_TYPES)
+
+    def matches(self, actual: Any) -> bool:
+        return (
+            self._valid_expected
+            and isinstance(actual, _NUMERIC_TYPES)
+            and actual < self.expected
+        )
+
+    def matches_all(self, iterable) -> list[bool]:
+        """複数の値をまとめて判定して真偽値リストを返す
+
+        属性検索をループの外に束縛し、要素ごとのオーバーヘッドを
+        matches()の繰り返し呼び出しより小さく抑えます。
+        """
+        if not self._valid_expected:
+            return [False for _ in iterable]
+        expected = self.expected
+        numeric = _NUMERIC_TYPES
+        return [isinstance(v, numeric) and v < expected for v in iterable]
+
+    def describe_mismatch(self, actual: Any) -> str:
+        if not isinstance(actual, (int, float)):
+            return f"was {type(actual).__name__} {actual}, expected number"
+        return f"was {actual}"
+
+    def describe_expected(self) -> str:
+        return f"number less than {self.expected}"
+
+
+def greater_than(value: Union[int, float]) -> SmartMatcher:
+    """指定値より大きいかチェックするマッチャーを作成
+
+    Args:
+        value: 比較する値
+
+    Returns:
+        SmartMatcher: 大小比較マッチャー
+
+    Example:
+        assert 10 == greater_than(5)
+    """
+    return SmartMatcher(GreaterThanMatcher(value))
+
+
+def less_than(value: Union[int, float]) -> SmartMatcher:
+    """指定値より小さいかチェックするマッチャーを作成
+
+    Args:
+        value: 比較する値
+
+    Returns:
+        SmartMatcher: 大小比較マッチャー
+
+    Example:
+        assert 3 == less_than(10)
+    """
+    return SmartMatcher(LessThanMatcher(value))
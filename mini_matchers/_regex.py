@@ -0,0 +1,124 @@
+"""
+正規表現マッチャーモジュール
+
+reモジュール（およびオプションのre2）はこのモジュールでのみ
+インポートされ、regex系マッチャーを使わない限り読み込まれません。
+"""
+
+import functools
+import re
+from typing import Any
+
+from ._base import SmartMatcher
+
+# オプショナルな線形時間正規表現エンジン（インストールされていればre2を利用可能）
+try:
+    import re2 as _re2  # type: ignore[import-not-found]
+except ImportError:
+    _re2 = None
+
+_use_re2 = _re2 is not None
+
+
+def use_re2(enabled: bool) -> None:
+    """正規表現エンジンとしてre2を使用するかを切り替える
+
+    re2はバックトラックしない線形時間エンジンで、病的なパターンでも
+    実行時間が入力長に比例します。後方参照などre2が扱えないパターンは
+    自動的にreへフォールバックします。
+
+    Args:
+        enabled: Trueでre2を使用（要インストール）、Falseで標準のreを使用
+
+    Raises:
+        ImportError: re2がインストールされていない状態で有効化した場合
+    """
+    global _use_re2
+    if enabled and _re2 is None:
+        raise ImportError("re2 is not installed")
+    _use_re2 = enabled
+    # エンジン切り替え前にコンパイルしたパターンを破棄する
+    _compile_regex.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """コンパイル済み正規表現をキャッシュして返す
+
+    同一パターンの繰り返しコンパイルを避けるためのメモ化ヘルパー。
+    reモジュール内部のキャッシュ（512件）とは独立して保持します。
+    re2が有効な場合はre2でのコンパイルを試み、コンパイルできない
+    パターン（後方参照等）はreへフォールバックします。
+    """
+    if _use_re2:
+        try:
+            return _re2.compile(pattern, flags)
+        except _re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+class RegexMatcher:
+    """正規表現にマッチするかチェックするマッチャー
+
+    注意: 高速化のため実際の値の型チェックは ``type(actual) is str`` で
+    行います。strのサブクラスはマッチ対象外になります。
+    """
+
+    __slots__ = ('expected', 'negated', 'flags', 'compiled_pattern', '_search')
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.expected = pattern
+        self.negated = False
+        self.flags = flags
+        self.compiled_pattern = _compile_regex(pattern, flags)
+        # 比較ごとの属性検索を省くためsearchを束縛しておく
+        self._search = self.compiled_pattern.search
+
+    def matches(self, actual: Any) -> bool:
+        return type(actual) is str and self._search(actual) is not None
+
+    def describe_mismatch(self, actual: Any) -> str:
+        if not isinstance(actual, str):
+            return f"was {type(actual).__name__} {actual}, expected string"
+        return f"was '{actual}'"
+
+    def describe_expected(self) -> str:
+        return f"string matching /{self.expected}/"
+
+
+def regex(pattern: str, flags: int = 0) -> SmartMatcher:
+    """正規表現マッチャーを作成
+
+    Args:
+        pattern: 正規表現パターン
+        flags: 正規表現フラグ（re.IGNORECASE等）
+
+    Returns:
+        SmartMatcher: 正規表現マッチャー
+
+    Example:
+        assert "test123" == regex(r"test\\d+")
+    """
+    return SmartMatcher(RegexMatcher(pattern, flags))
+
+
+def any_of_regex(*patterns: str, flags: int = 0) -> SmartMatcher:
+    """複数の正規表現のいずれかにマッチするかチェックするマッチャーを作成
+
+    各パターンを個別に検索する代わりに、選択（alternation）で結合した
+    単一の正規表現としてコンパイルします。同じパターン群を多数の要素に
+    対して繰り返し使う場合、正規表現エンジンの走査が1回で済みます。
+
+    Args:
+        *patterns: 正規表現パターン（いずれかにマッチすれば成功）
+        flags: 正規表現フラグ（re.IGNORECASE等）
+
+    Returns:
+        SmartMatcher: 結合された正規表現マッチャー
+
+    Example:
+        assert "user_42" == any_of_regex(r"user_\\d+", r"admin_\\d+")
+    """
+    combined = '|'.join(f'(?:{p})' for p in patterns)
+    return SmartMatcher(RegexMatcher(combined, flags))
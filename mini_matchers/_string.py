@@ -0,0 +1,98 @@
+"""
+文字列・選択肢マッチャーモジュール
+
+contains / any_of と対応するマッチャークラスを提供します。
+"""
+
+from typing import Any, Tuple
+
+from ._base import SmartMatcher
+
+
+class AnyOfMatcher:
+    """指定された値のいずれかと一致するかチェックするマッチャー"""
+
+    __slots__ = ('expected', 'negated', 'values', '_value_set')
+
+    def __init__(self, values: Tuple[Any, ...]):
+        self.expected = values
+        self.negated = False
+        self.values = values
+        try:
+            # ハッシュ可能な候補ならO(1)の集合検索を使う
+            self._value_set = frozenset(values)
+        except TypeError:
+            self._value_set = None
+
+    def matches(self, actual: Any) -> bool:
+        if self._value_set is not None:
+            try:
+                return actual in self._value_set
+            except TypeError:
+                # actual自体がハッシュ不可能な場合はタプル検索へ
+                return actual in self.values
+        return actual in self.values
+
+    def describe_mismatch(self, actual: Any) -> str:
+        return f"was {actual}"
+
+    def describe_expected(self) -> str:
+        return f"any of {list(self.values)}"
+
+
+class ContainsMatcher:
+    """指定された部分文字列を含むかチェックするマッチャー
+
+    注意: 高速化のため実際の値の型チェックは ``type(actual) is str`` で
+    行います。strのサブクラスはマッチ対象外になります。
+    """
+
+    __slots__ = ('expected', 'negated', '_needle', '_match')
+
+    def __init__(self, expected: str):
+        self.expected = expected
+        self.negated = False
+        # 属性検索を比較ごとに繰り返さないようローカルに束縛しておく
+        self._needle = expected
+        self._match = str.__contains__
+
+    def matches(self, actual: Any) -> bool:
+        return type(actual) is str and self._match(actual, self._needle)
+
+    def describe_mismatch(self, actual: Any) -> str:
+        if not isinstance(actual, str):
+            return f"was {type(actual).__name__} {actual}, expected string"
+        return f"was '{actual}'"
+
+    def describe_expected(self) -> str:
+        return f"string containing '{self.expected}'"
+
+
+def any_of(*values) -> SmartMatcher:
+    """指定された値のいずれかと一致するかチェックするマッチャーを作成
+
+    Args:
+        *values: 候補となる値のリスト
+
+    Returns:
+        SmartMatcher: 選択肢マッチャー
+
+    Example:
+        assert "success" == any_of("success", "completed", "done")
+    """
+    return SmartMatcher(AnyOfMatcher(values))
+
+
+def contains(substring: str) -> SmartMatcher:
+    """指定された部分文字列を含むかチェックするマッチャーを作成
+
+    Args:
+        substring: 検索する部分文字列
+
+    Returns:
+        SmartMatcher: 文字列包含マッチャー
+
+    Example:
+        assert "Hello World" == contains("World")
+    """
+    return SmartMatcher(ContainsMatcher(substring))
@@ -0,0 +1,86 @@
+"""
+時刻マッチャーモジュール
+
+datetimeモジュールはこのモジュールでのみインポートされ、
+around_nowを使わない限り読み込まれません。
+"""
+
+import functools
+from datetime import datetime
+from typing import Any
+
+from ._base import SmartMatcher
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso_datetime(value: str):
+    """ISO形式文字列をdatetimeへパースする（失敗時はNone）
+
+    末尾が'Z'の場合のみ'+00:00'へ置換し、それ以外は割り当てを伴う
+    str.replaceを行いません。同じ文字列に対する繰り返しパースは
+    キャッシュから返されます。
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class AroundNowMatcher:
+    """現在時刻の前後指定秒数以内かチェックするマッチャー"""
+
+    __slots__ = ('expected', 'negated', 'now', '_now_ts', '_tol_s')
+
+    def __init__(self, tolerance_seconds: int):
+        self.expected = tolerance_seconds
+        self.negated = False
+        self.now = datetime.now()
+        # 比較のたびにdatetime/timedeltaを生成しないようエポック秒で持つ
+        self._now_ts = self.now.timestamp()
+        self._tol_s = float(tolerance_seconds)
+
+    def matches(self, actual: Any) -> bool:
+        if isinstance(actual, str):
+            # ISO形式の文字列をパース（キャッシュ付き）
+            actual_dt = _parse_iso_datetime(actual)
+            if actual_dt is None:
+                return False
+        elif isinstance(actual, datetime):
+            actual_dt = actual
+        else:
+            return False
+
+        if actual_dt.tzinfo is not None:
+            # 従来どおりタイムゾーン情報を外して壁時計で比較する
+            actual_dt = actual_dt.replace(tzinfo=None)
+        return abs(actual_dt.timestamp() - self._now_ts) <= self._tol_s
+
+    def describe_mismatch(self, actual: Any) -> str:
+        if isinstance(actual, str):
+            return f"was string '{actual}'"
+        elif isinstance(actual, datetime):
+            diff = abs(actual - self.now)
+            return f"was {actual}, which is {diff.total_seconds():.1f} seconds from now"
+        else:
+            return f"was {type(actual).__name__} {actual}, expected datetime or ISO string"
+
+    def describe_expected(self) -> str:
+        return f"datetime within {self.expected} seconds of {self.now}"
+
+
+def around_now(tolerance_seconds: int = 60) -> SmartMatcher:
+    """現在時刻の前後指定秒数以内かチェックするマッチャーを作成
+
+    Args:
+        tolerance_seconds: 許容する秒数（デフォルト: 60秒）
+
+    Returns:
+        SmartMatcher: 時刻範囲マッチャー
+
+    Example:
+        assert datetime.now() == around_now()
+        assert datetime.now() == around_now(300)  # 5分以内
+    """
+    return SmartMatcher(AroundNowMatcher(tolerance_seconds))
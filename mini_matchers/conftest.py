@@ -0,0 +1,22 @@
+"""
+mini-matchersテスト用の共有フィクスチャ
+
+同一の数値マッチャーをセッション全体で使い回し、繰り返し実行時の
+アロケーションを抑えます。
+"""
+
+import pytest
+
+from .matchers import greater_than, less_than
+
+
+@pytest.fixture(scope="session")
+def gt5():
+    """5より大きいかチェックするマッチャー（セッションで1回だけ構築）"""
+    return greater_than(5)
+
+
+@pytest.fixture(scope="session")
+def lt10():
+    """10より小さいかチェックするマッチャー（セッションで1回だけ構築）"""
+    return less_than(10)
@@ -11,11 +11,13 @@ from .matchers import (
     MatcherProtocol,
     SmartMatcher,
     regex,
+    any_of_regex,
     around_now,
     greater_than,
     less_than,
     any_of,
     contains,
+    expect,
     RegexMatcher,
     AroundNowMatcher,
     GreaterThanMatcher,
@@ -29,32 +31,58 @@ from .matchers import (
 # 型安全性はmypyで保証、基本機能は実際のマッチャーテストでカバー
 
 
+# モジュールロード時に1回だけコンパイルして全テストで再利用するマッチャー
+_EMAIL_MATCHER = regex(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+_SEMVER_MATCHER = regex(r"\d+\.\d+\.\d+")
+
+
+# ===== 共有フィクスチャ（マッチャー構築をアサーションごとに繰り返さない） =====
+
+@pytest.fixture(scope="module")
+def digit_regex():
+    """数字にマッチする正規表現マッチャー（モジュールで1回だけ構築）"""
+    return regex(r"\d+")
+
+
+@pytest.fixture(scope="module")
+def hello_contains():
+    """'hello'を含むかチェックするマッチャー（モジュールで1回だけ構築）"""
+    return contains("hello")
+
+
+@pytest.fixture(scope="module")
+def status_any_of():
+    """ステータス候補のany_ofマッチャー（モジュールで1回だけ構築）"""
+    return any_of("success", "completed", "done")
+
+
 # ===== スマートマッチャーのテスト =====
 
 class TestSmartMatcher:
     """SmartMatcherクラスのテスト"""
-    
-    def test_smart_matcher_equality_success(self):
-        """SmartMatcherの等価性チェック成功ケース"""
-        matcher = SmartMatcher(RegexMatcher(r"\d+"))
-        
-        # == 演算子でマッチング
-        assert "123" == matcher
-        assert matcher == "456"
-    
-    def test_smart_matcher_equality_failure(self):
-        """SmartMatcherの等価性チェック失敗ケース"""
-        matcher = SmartMatcher(RegexMatcher(r"\d+"))
-        
-        # マッチしない場合はFalse
-        assert not ("abc" == matcher)
-        assert not (matcher == "xyz")
-    
-    def test_smart_matcher_repr(self):
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def digit_smart_matcher():
+        """数字用SmartMatcher（クラスで1回だけ構築・コンパイル）"""
+        return SmartMatcher(RegexMatcher(r"\d+"))
+
+    @pytest.mark.parametrize("s,ok", [
+        ("123", True),
+        ("456", True),
+        ("abc", False),
+        ("xyz", False),
+    ])
+    def test_smart_matcher_equality(self, digit_smart_matcher, s, ok):
+        """SmartMatcherの等価性チェック（成功・失敗ケース）"""
+        # == 演算子でマッチング（両方のオペランド順をチェック）
+        assert (s == digit_smart_matcher) is ok
+        assert (digit_smart_matcher == s) is ok
+
+    def test_smart_matcher_repr(self, digit_smart_matcher):
         """SmartMatcherの文字列表現"""
-        matcher = SmartMatcher(RegexMatcher(r"\d+"))
-        repr_str = repr(matcher)
-        
+        repr_str = repr(digit_smart_matcher)
+
         assert "SmartMatcher" in repr_str
         assert "string matching" in repr_str
 
@@ -88,13 +116,34 @@ class TestRegexFunction:
         assert "user.name@domain.co.jp" == email_pattern
         assert not ("invalid-email" == email_pattern)
     
-    def test_regex_with_non_string(self):
+    @pytest.mark.parametrize("val", [
+        pytest.param(123, id="int"),
+        pytest.param(None, id="none"),
+        pytest.param([], id="list"),
+    ])
+    def test_regex_with_non_string(self, digit_regex, val):
         """文字列以外の値でのテスト"""
-        pattern_matcher = regex(r"\d+")
-        
-        assert not (123 == pattern_matcher)
-        assert not (None == pattern_matcher)
-        assert not ([] == pattern_matcher)
+        assert not (val == digit_regex)
+
+
+class TestAnyOfRegexFunction:
+    """any_of_regex関数のテスト"""
+
+    def test_any_of_regex_basic(self):
+        """複数パターンのいずれかにマッチ"""
+        id_matcher = any_of_regex(r"user_\d+", r"admin_\d+")
+
+        assert "user_42" == id_matcher
+        assert "admin_1" == id_matcher
+        assert not ("guest_42" == id_matcher)
+
+    def test_any_of_regex_with_flags(self):
+        """フラグ付きの複数パターンマッチ"""
+        word_matcher = any_of_regex(r"hello", r"world", flags=re.IGNORECASE)
+
+        assert "HELLO" == word_matcher
+        assert "World" == word_matcher
+        assert not ("goodbye" == word_matcher)
 
 
 class TestAroundNowFunction:
@@ -102,17 +151,19 @@ class TestAroundNowFunction:
     
     def test_around_now_with_datetime(self):
         """datetime オブジェクトでのテスト"""
+        # 現在時刻は1回だけ取得して使い回す
+        now = datetime.now()
         now_matcher = around_now(60)  # 1分以内
-        
+
         # 現在時刻
-        assert datetime.now() == now_matcher
-        
+        assert now == now_matcher
+
         # 30秒前
-        past_time = datetime.now() - timedelta(seconds=30)
+        past_time = now - timedelta(seconds=30)
         assert past_time == now_matcher
-        
+
         # 30秒後
-        future_time = datetime.now() + timedelta(seconds=30)
+        future_time = now + timedelta(seconds=30)
         assert future_time == now_matcher
     
     def test_around_now_with_iso_string(self):
@@ -125,14 +176,16 @@ class TestAroundNowFunction:
     
     def test_around_now_tolerance(self):
         """許容範囲のテスト"""
+        # 現在時刻は1回だけ取得して使い回す
+        now = datetime.now()
         strict_matcher = around_now(10)  # 10秒以内
-        
+
         # 5秒前は成功
-        recent_time = datetime.now() - timedelta(seconds=5)
+        recent_time = now - timedelta(seconds=5)
         assert recent_time == strict_matcher
-        
+
         # 15秒前は失敗
-        old_time = datetime.now() - timedelta(seconds=15)
+        old_time = now - timedelta(seconds=15)
         assert not (old_time == strict_matcher)
     
     def test_around_now_with_invalid_type(self):
@@ -147,25 +200,27 @@ class TestAroundNowFunction:
 class TestNumericComparisons:
     """数値比較関数のテスト"""
     
-    def test_greater_than(self):
+    @pytest.mark.parametrize("val,expected", [
+        (10, True),
+        (5.1, True),
+        (5, False),
+        (3, False),
+        ("10", False),  # 文字列は失敗
+    ])
+    def test_greater_than(self, gt5, val, expected):
         """greater_than関数のテスト"""
-        gt_matcher = greater_than(5)
-        
-        assert 10 == gt_matcher
-        assert 5.1 == gt_matcher
-        assert not (5 == gt_matcher)
-        assert not (3 == gt_matcher)
-        assert not ("10" == gt_matcher)  # 文字列は失敗
-    
-    def test_less_than(self):
+        assert (val == gt5) is expected
+
+    @pytest.mark.parametrize("val,expected", [
+        (5, True),
+        (9.9, True),
+        (10, False),
+        (15, False),
+        ("5", False),  # 文字列は失敗
+    ])
+    def test_less_than(self, lt10, val, expected):
         """less_than関数のテスト"""
-        lt_matcher = less_than(10)
-        
-        assert 5 == lt_matcher
-        assert 9.9 == lt_matcher
-        assert not (10 == lt_matcher)
-        assert not (15 == lt_matcher)
-        assert not ("5" == lt_matcher)  # 文字列は失敗
+        assert (val == lt10) is expected
     
     def test_numeric_with_float(self):
         """浮動小数点数でのテスト"""
@@ -181,14 +236,15 @@ class TestNumericComparisons:
 class TestAnyOfFunction:
     """any_of関数のテスト"""
     
-    def test_any_of_basic(self):
+    @pytest.mark.parametrize("val,ok", [
+        ("success", True),
+        ("completed", True),
+        ("done", True),
+        ("failed", False),
+    ])
+    def test_any_of_basic(self, status_any_of, val, ok):
         """基本的なany_ofテスト"""
-        status_matcher = any_of("success", "completed", "done")
-        
-        assert "success" == status_matcher
-        assert "completed" == status_matcher
-        assert "done" == status_matcher
-        assert not ("failed" == status_matcher)
+        assert (val == status_any_of) is ok
     
     def test_any_of_mixed_types(self):
         """混合型でのany_ofテスト"""
@@ -211,14 +267,15 @@ class TestAnyOfFunction:
 class TestContainsFunction:
     """contains関数のテスト"""
     
-    def test_contains_basic(self):
+    @pytest.mark.parametrize("val,ok", [
+        ("hello world", True),
+        ("say hello", True),
+        ("hello", True),
+        ("hi there", False),
+    ])
+    def test_contains_basic(self, hello_contains, val, ok):
         """基本的なcontainsテスト"""
-        hello_matcher = contains("hello")
-        
-        assert "hello world" == hello_matcher
-        assert "say hello" == hello_matcher
-        assert "hello" == hello_matcher
-        assert not ("hi there" == hello_matcher)
+        assert (val == hello_contains) is ok
     
     def test_contains_case_sensitive(self):
         """大文字小文字を区別するテスト"""
@@ -227,41 +284,97 @@ class TestContainsFunction:
         assert "Hello World" == hello_matcher
         assert not ("hello world" == hello_matcher)
     
-    def test_contains_with_non_string(self):
+    @pytest.mark.parametrize("val", [
+        pytest.param(123, id="int"),
+        pytest.param(["hello"], id="list"),
+        pytest.param(None, id="none"),
+    ])
+    def test_contains_with_non_string(self, hello_contains, val):
         """文字列以外でのテスト"""
-        hello_matcher = contains("hello")
-        
-        assert not (123 == hello_matcher)
-        assert not (["hello"] == hello_matcher)
-        assert not (None == hello_matcher)
+        assert not (val == hello_contains)
+
+
+class TestExpectFunction:
+    """expect関数のテスト"""
+
+    def test_expect_flat_dict(self):
+        """フラットな辞書でのexpectテスト"""
+        actual = {"id": 123, "status": "active"}
+
+        assert actual == expect({
+            "id": greater_than(100),
+            "status": any_of("active", "inactive"),
+        })
+        assert not (actual == expect({"id": greater_than(200), "status": "active"}))
+
+    def test_expect_nested_dict(self):
+        """ネストされた辞書でのexpectテスト"""
+        actual = {
+            "user": {"name": "Alice", "scores": [10, 20]},
+        }
+
+        assert actual == expect({
+            "user": {"name": contains("lic"), "scores": [10, greater_than(15)]},
+        })
+
+    def test_expect_key_mismatch(self):
+        """キーの過不足があるケース"""
+        actual = {"id": 123, "extra": True}
+
+        assert not (actual == expect({"id": 123}))
+        assert not (actual == expect({"id": 123, "missing": 1}))
 
 
 # ===== 複雑なシナリオのテスト =====
 
 class TestComplexScenarios:
     """複雑なシナリオのテスト"""
-    
-    def test_dictionary_with_smart_matchers(self):
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def expected_user_dict():
+        """ユーザー辞書の期待値（マッチャー群をクラスで1回だけ構築）"""
+        return {
+            "id": greater_than(100),
+            "name": contains("User"),
+            "email": _EMAIL_MATCHER,
+            "created_at": around_now(),
+            "status": any_of("active", "inactive", "pending")
+        }
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def expected_nested_dict():
+        """ネスト辞書の期待値（マッチャー群をクラスで1回だけ構築）"""
+        return {
+            "user": {
+                "profile": {
+                    "age": greater_than(18),
+                    "bio": contains("developer")
+                }
+            },
+            "metadata": {
+                "version": _SEMVER_MATCHER,
+                "timestamp": around_now()
+            }
+        }
+
+    def test_dictionary_with_smart_matchers(self, expected_user_dict):
         """辞書でのスマートマッチャー使用"""
+        # タイムスタンプは1回だけ取得し、actualの構築と検証の両方に使う
+        ts = datetime.now()
         actual = {
             "id": 123,
             "name": "Test User",
             "email": "test@example.com",
-            "created_at": datetime.now(),
+            "created_at": ts,
             "status": "active"
         }
-        
-        expected = {
-            "id": greater_than(100),
-            "name": contains("User"),
-            "email": regex(r"^[\w\.-]+@[\w\.-]+\.\w+$"),
-            "created_at": around_now(),
-            "status": any_of("active", "inactive", "pending")
-        }
-        
-        assert actual == expected
-    
-    def test_nested_dictionary(self):
+
+        assert ts == around_now(60)
+        assert actual == expected_user_dict
+
+    def test_nested_dictionary(self, expected_nested_dict):
         """ネストされた辞書でのテスト"""
         actual = {
             "user": {
@@ -275,21 +388,8 @@ class TestComplexScenarios:
                 "timestamp": datetime.now()
             }
         }
-        
-        expected = {
-            "user": {
-                "profile": {
-                    "age": greater_than(18),
-                    "bio": contains("developer")
-                }
-            },
-            "metadata": {
-                "version": regex(r"\d+\.\d+\.\d+"),
-                "timestamp": around_now()
-            }
-        }
-        
-        assert actual == expected
+
+        assert actual == expected_nested_dict
     
     def test_list_with_smart_matchers(self):
         """リストでのスマートマッチャー使用"""
@@ -305,8 +405,4 @@ class TestComplexScenarios:
             {"id": 3, "name": contains("Item")}
         ]
         
-        assert actual == expected
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+        assert actual == expected
\ No newline at end of file